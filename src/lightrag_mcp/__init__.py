@@ -2,4 +2,20 @@
 MCP Server для интеграции с LightRAG API.
 """
 
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lightrag_mcp.lightrag_client import LightRAGClient
+
 __version__ = "0.1.0"
+
+__all__ = ["LightRAGClient", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # LightRAGClient pulls in httpx and the generated client, import it only when requested
+    if name == "LightRAGClient":
+        from lightrag_mcp.lightrag_client import LightRAGClient
+
+        return LightRAGClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
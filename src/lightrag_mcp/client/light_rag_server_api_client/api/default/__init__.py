@@ -1,14 +1,19 @@
 """Contains endpoint functions for accessing the API"""
 
-# Импортируем модули для удобства использования
-from .get_auth_status_auth_status_get import asyncio_detailed as async_get_auth_status
-from .get_auth_status_auth_status_get import sync_detailed as get_auth_status
-from .get_status_health_get import asyncio as async_get_health
-from .get_status_health_get import sync as get_health
-from .login_login_post import asyncio as async_login
-from .login_login_post import sync as login
-from .redirect_to_webui_get import asyncio_detailed as async_redirect_to_webui
-from .redirect_to_webui_get import sync_detailed as redirect_to_webui
+import importlib
+from typing import Any
+
+# Endpoint functions are resolved on first access to avoid importing every module up front
+_LAZY = {
+    "async_get_auth_status": (".get_auth_status_auth_status_get", "asyncio_detailed"),
+    "get_auth_status": (".get_auth_status_auth_status_get", "sync_detailed"),
+    "async_get_health": (".get_status_health_get", "asyncio"),
+    "get_health": (".get_status_health_get", "sync"),
+    "async_login": (".login_login_post", "asyncio"),
+    "login": (".login_login_post", "sync"),
+    "async_redirect_to_webui": (".redirect_to_webui_get", "asyncio_detailed"),
+    "redirect_to_webui": (".redirect_to_webui_get", "sync_detailed"),
+}
 
 __all__ = [
     "get_health",
@@ -20,3 +25,16 @@ __all__ = [
     "redirect_to_webui",
     "async_redirect_to_webui",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
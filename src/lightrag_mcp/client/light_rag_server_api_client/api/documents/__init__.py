@@ -1,24 +1,29 @@
 """Contains endpoint functions for accessing the API"""
 
-# Импортируем модули для удобства использования
-from .clear_documents_documents_delete import asyncio as async_clear_documents
-from .clear_documents_documents_delete import sync as clear_documents
-from .documents_documents_get import asyncio as async_get_documents
-from .documents_documents_get import sync as get_documents
-from .get_pipeline_status_documents_pipeline_status_get import asyncio as async_get_pipeline_status
-from .get_pipeline_status_documents_pipeline_status_get import sync as get_pipeline_status
-from .insert_batch_documents_file_batch_post import asyncio as async_insert_batch
-from .insert_batch_documents_file_batch_post import sync as insert_batch
-from .insert_file_documents_file_post import asyncio as async_insert_file
-from .insert_file_documents_file_post import sync as insert_file
-from .insert_text_documents_text_post import asyncio as async_insert_document
-from .insert_text_documents_text_post import sync as insert_document
-from .insert_texts_documents_texts_post import asyncio as async_insert_texts
-from .insert_texts_documents_texts_post import sync as insert_texts
-from .scan_for_new_documents_documents_scan_post import asyncio as async_scan_for_new_documents
-from .scan_for_new_documents_documents_scan_post import sync as scan_for_new_documents
-from .upload_to_input_dir_documents_upload_post import asyncio as async_upload_document
-from .upload_to_input_dir_documents_upload_post import sync as upload_document
+import importlib
+from typing import Any
+
+# Endpoint functions are resolved on first access to avoid importing every module up front
+_LAZY = {
+    "async_clear_documents": (".clear_documents_documents_delete", "asyncio"),
+    "clear_documents": (".clear_documents_documents_delete", "sync"),
+    "async_get_documents": (".documents_documents_get", "asyncio"),
+    "get_documents": (".documents_documents_get", "sync"),
+    "async_get_pipeline_status": (".get_pipeline_status_documents_pipeline_status_get", "asyncio"),
+    "get_pipeline_status": (".get_pipeline_status_documents_pipeline_status_get", "sync"),
+    "async_insert_batch": (".insert_batch_documents_file_batch_post", "asyncio"),
+    "insert_batch": (".insert_batch_documents_file_batch_post", "sync"),
+    "async_insert_file": (".insert_file_documents_file_post", "asyncio"),
+    "insert_file": (".insert_file_documents_file_post", "sync"),
+    "async_insert_document": (".insert_text_documents_text_post", "asyncio"),
+    "insert_document": (".insert_text_documents_text_post", "sync"),
+    "async_insert_texts": (".insert_texts_documents_texts_post", "asyncio"),
+    "insert_texts": (".insert_texts_documents_texts_post", "sync"),
+    "async_scan_for_new_documents": (".scan_for_new_documents_documents_scan_post", "asyncio"),
+    "scan_for_new_documents": (".scan_for_new_documents_documents_scan_post", "sync"),
+    "async_upload_document": (".upload_to_input_dir_documents_upload_post", "asyncio"),
+    "upload_document": (".upload_to_input_dir_documents_upload_post", "sync"),
+}
 
 __all__ = [
     "clear_documents",
@@ -40,3 +45,16 @@ __all__ = [
     "upload_document",
     "async_upload_document",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
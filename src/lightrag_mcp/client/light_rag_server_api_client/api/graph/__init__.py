@@ -1,26 +1,29 @@
 """Contains endpoint functions for accessing the API"""
 
-# Импортируем модули для удобства использования
-from .create_entity_entities_entity_name_post import asyncio as async_create_entity
-from .create_entity_entities_entity_name_post import sync as create_entity
-from .create_relation_relations_source_target_post import (
-    asyncio as async_create_relation,
-)
-from .create_relation_relations_source_target_post import sync as create_relation
-from .delete_by_doc_id_documents_doc_id_delete import asyncio as async_delete_by_doc_id
-from .delete_by_doc_id_documents_doc_id_delete import sync as delete_by_doc_id
-from .delete_entity_entities_entity_name_delete import asyncio as async_delete_entity
-from .delete_entity_entities_entity_name_delete import sync as delete_entity
-from .edit_entity_entities_entity_name_put import asyncio as async_edit_entity
-from .edit_entity_entities_entity_name_put import sync as edit_entity
-from .edit_relation_relations_source_target_put import asyncio as async_edit_relation
-from .edit_relation_relations_source_target_put import sync as edit_relation
-from .get_graph_labels_graph_label_list_get import asyncio as async_get_graph_labels
-from .get_graph_labels_graph_label_list_get import sync as get_graph_labels
-from .get_knowledge_graph_graphs_get import asyncio as async_get_knowledge_graph
-from .get_knowledge_graph_graphs_get import sync as get_knowledge_graph
-from .merge_entities_entities_merge_post import asyncio as async_merge_entities
-from .merge_entities_entities_merge_post import sync as merge_entities
+import importlib
+from typing import Any
+
+# Endpoint functions are resolved on first access to avoid importing every module up front
+_LAZY = {
+    "async_create_entity": (".create_entity_entities_entity_name_post", "asyncio"),
+    "create_entity": (".create_entity_entities_entity_name_post", "sync"),
+    "async_create_relation": (".create_relation_relations_source_target_post", "asyncio"),
+    "create_relation": (".create_relation_relations_source_target_post", "sync"),
+    "async_delete_by_doc_id": (".delete_by_doc_id_documents_doc_id_delete", "asyncio"),
+    "delete_by_doc_id": (".delete_by_doc_id_documents_doc_id_delete", "sync"),
+    "async_delete_entity": (".delete_entity_entities_entity_name_delete", "asyncio"),
+    "delete_entity": (".delete_entity_entities_entity_name_delete", "sync"),
+    "async_edit_entity": (".edit_entity_entities_entity_name_put", "asyncio"),
+    "edit_entity": (".edit_entity_entities_entity_name_put", "sync"),
+    "async_edit_relation": (".edit_relation_relations_source_target_put", "asyncio"),
+    "edit_relation": (".edit_relation_relations_source_target_put", "sync"),
+    "async_get_graph_labels": (".get_graph_labels_graph_label_list_get", "asyncio"),
+    "get_graph_labels": (".get_graph_labels_graph_label_list_get", "sync"),
+    "async_get_knowledge_graph": (".get_knowledge_graph_graphs_get", "asyncio"),
+    "get_knowledge_graph": (".get_knowledge_graph_graphs_get", "sync"),
+    "async_merge_entities": (".merge_entities_entities_merge_post", "asyncio"),
+    "merge_entities": (".merge_entities_entities_merge_post", "sync"),
+}
 
 __all__ = [
     "get_graph_labels",
@@ -42,3 +45,16 @@ __all__ = [
     "delete_by_doc_id",
     "async_delete_by_doc_id",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
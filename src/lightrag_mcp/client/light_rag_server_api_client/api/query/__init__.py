@@ -1,10 +1,15 @@
 """Contains endpoint functions for accessing the API"""
 
-# Импортируем модули для удобства использования
-from .query_text_query_post import asyncio as async_query_document
-from .query_text_query_post import sync as query_document
-from .query_text_stream_query_stream_post import asyncio as async_query_document_stream
-from .query_text_stream_query_stream_post import sync as query_document_stream
+import importlib
+from typing import Any
+
+# Endpoint functions are resolved on first access to avoid importing every module up front
+_LAZY = {
+    "async_query_document": (".query_text_query_post", "asyncio"),
+    "query_document": (".query_text_query_post", "sync"),
+    "async_query_document_stream": (".query_text_stream_query_stream_post", "asyncio"),
+    "query_document_stream": (".query_text_stream_query_stream_post", "sync"),
+}
 
 __all__ = [
     "query_document",
@@ -12,3 +17,16 @@ __all__ = [
     "query_document_stream",
     "async_query_document_stream",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
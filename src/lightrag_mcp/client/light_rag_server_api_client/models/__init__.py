@@ -1,34 +1,39 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .body_insert_batch_documents_file_batch_post import BodyInsertBatchDocumentsFileBatchPost
-from .body_insert_file_documents_file_post import BodyInsertFileDocumentsFilePost
-from .body_login_login_post import BodyLoginLoginPost
-from .body_upload_to_input_dir_documents_upload_post import BodyUploadToInputDirDocumentsUploadPost
-from .doc_status import DocStatus
-from .doc_status_response import DocStatusResponse
-from .doc_status_response_metadata_type_0 import DocStatusResponseMetadataType0
-from .docs_statuses_response import DocsStatusesResponse
-from .docs_statuses_response_statuses import DocsStatusesResponseStatuses
-from .entity_request import EntityRequest
-from .http_validation_error import HTTPValidationError
-from .insert_response import InsertResponse
-from .insert_text_request import InsertTextRequest
-from .insert_texts_request import InsertTextsRequest
-from .merge_entities_request import MergeEntitiesRequest
-from .merge_entities_request_merge_strategy_type_0 import MergeEntitiesRequestMergeStrategyType0
-from .ollama_chat_request import OllamaChatRequest
-from .ollama_chat_request_options_type_0 import OllamaChatRequestOptionsType0
-from .ollama_generate_request import OllamaGenerateRequest
-from .ollama_generate_request_options_type_0 import OllamaGenerateRequestOptionsType0
-from .ollama_message import OllamaMessage
-from .pipeline_status_response import PipelineStatusResponse
-from .pipeline_status_response_update_status_type_0 import PipelineStatusResponseUpdateStatusType0
-from .query_request import QueryRequest
-from .query_request_conversation_history_type_0_item import QueryRequestConversationHistoryType0Item
-from .query_request_mode import QueryRequestMode
-from .query_response import QueryResponse
-from .relation_request import RelationRequest
-from .validation_error import ValidationError
+import importlib
+from typing import Any
+
+_LAZY = {
+    "BodyInsertBatchDocumentsFileBatchPost": ".body_insert_batch_documents_file_batch_post",
+    "BodyInsertFileDocumentsFilePost": ".body_insert_file_documents_file_post",
+    "BodyLoginLoginPost": ".body_login_login_post",
+    "BodyUploadToInputDirDocumentsUploadPost": ".body_upload_to_input_dir_documents_upload_post",
+    "DocStatus": ".doc_status",
+    "DocStatusResponse": ".doc_status_response",
+    "DocStatusResponseMetadataType0": ".doc_status_response_metadata_type_0",
+    "DocsStatusesResponse": ".docs_statuses_response",
+    "DocsStatusesResponseStatuses": ".docs_statuses_response_statuses",
+    "EntityRequest": ".entity_request",
+    "HTTPValidationError": ".http_validation_error",
+    "InsertResponse": ".insert_response",
+    "InsertTextRequest": ".insert_text_request",
+    "InsertTextsRequest": ".insert_texts_request",
+    "MergeEntitiesRequest": ".merge_entities_request",
+    "MergeEntitiesRequestMergeStrategyType0": ".merge_entities_request_merge_strategy_type_0",
+    "OllamaChatRequest": ".ollama_chat_request",
+    "OllamaChatRequestOptionsType0": ".ollama_chat_request_options_type_0",
+    "OllamaGenerateRequest": ".ollama_generate_request",
+    "OllamaGenerateRequestOptionsType0": ".ollama_generate_request_options_type_0",
+    "OllamaMessage": ".ollama_message",
+    "PipelineStatusResponse": ".pipeline_status_response",
+    "PipelineStatusResponseUpdateStatusType0": ".pipeline_status_response_update_status_type_0",
+    "QueryRequest": ".query_request",
+    "QueryRequestConversationHistoryType0Item": ".query_request_conversation_history_type_0_item",
+    "QueryRequestMode": ".query_request_mode",
+    "QueryResponse": ".query_response",
+    "RelationRequest": ".relation_request",
+    "ValidationError": ".validation_error",
+}
 
 __all__ = (
     "BodyInsertBatchDocumentsFileBatchPost",
@@ -63,3 +68,17 @@ __all__ = (
     "RelationRequestProperties",
     "ValidationError",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # Models are imported on first access (PEP 562) to keep package import cheap
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -3,31 +3,137 @@ Configuration module for LightRAG MCP server.
 """
 
 import argparse
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9621
 DEFAULT_API_KEY = ""
+DEFAULT_MCP_TRANSPORT = "stdio"
+DEFAULT_MCP_HOST = "127.0.0.1"
+DEFAULT_MCP_PORT = 8000
+MCP_TRANSPORTS = ("stdio", "sse", "streamable-http")
+DEFAULT_QUERY_CACHE_SIZE = 1024
+DEFAULT_QUERY_CACHE_TTL = 60.0
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load variables from .env file once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return True
 
 
 def parse_args():
     """Parse command line arguments for LightRAG MCP server."""
+    _load_env()
+    host = os.getenv("LIGHTRAG_API_HOST", DEFAULT_HOST)
+    port = int(os.getenv("LIGHTRAG_API_PORT", DEFAULT_PORT))
+    api_key = os.getenv("LIGHTRAG_API_KEY", DEFAULT_API_KEY)
+    transport = os.getenv("LIGHTRAG_MCP_TRANSPORT", DEFAULT_MCP_TRANSPORT)
+    mcp_host = os.getenv("LIGHTRAG_MCP_HOST", DEFAULT_MCP_HOST)
+    mcp_port = int(os.getenv("LIGHTRAG_MCP_PORT", DEFAULT_MCP_PORT))
+    query_cache_size = int(os.getenv("LIGHTRAG_QUERY_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE))
+    query_cache_ttl = float(os.getenv("LIGHTRAG_QUERY_CACHE_TTL", DEFAULT_QUERY_CACHE_TTL))
+
     parser = argparse.ArgumentParser(description="LightRAG MCP Server")
+    parser.add_argument("--host", default=host, help=f"LightRAG API host (default: {host})")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=port,
+        help=f"LightRAG API port (default: {port})",
+    )
+    parser.add_argument("--api-key", default=api_key, help="LightRAG API key (optional)")
     parser.add_argument(
-        "--host", default=DEFAULT_HOST, help=f"LightRAG API host (default: {DEFAULT_HOST})"
+        "--transport",
+        choices=MCP_TRANSPORTS,
+        default=transport,
+        help=f"MCP transport (default: {transport})",
     )
     parser.add_argument(
-        "--port",
+        "--mcp-host",
+        default=mcp_host,
+        help=f"Host to bind for sse/streamable-http transports (default: {mcp_host})",
+    )
+    parser.add_argument(
+        "--mcp-port",
         type=int,
-        default=DEFAULT_PORT,
-        help=f"LightRAG API port (default: {DEFAULT_PORT})",
+        default=mcp_port,
+        help=f"Port to bind for sse/streamable-http transports (default: {mcp_port})",
     )
-    parser.add_argument("--api-key", default=DEFAULT_API_KEY, help="LightRAG API key (optional)")
-    return parser.parse_args()
+    parser.add_argument(
+        "--query-cache-size",
+        type=int,
+        default=query_cache_size,
+        help=f"Maximum number of cached query results (default: {query_cache_size})",
+    )
+    parser.add_argument(
+        "--query-cache-ttl",
+        type=float,
+        default=query_cache_ttl,
+        help=f"Seconds to reuse a query result, 0 disables caching (default: {query_cache_ttl})",
+    )
+    args = parser.parse_args()
+    # argparse only checks choices for values given on the command line, not for defaults
+    if args.transport not in MCP_TRANSPORTS:
+        parser.error(
+            f"invalid LIGHTRAG_MCP_TRANSPORT {args.transport!r} "
+            f"(choose from {', '.join(MCP_TRANSPORTS)})"
+        )
+    return args
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Resolved LightRAG MCP server settings."""
 
+    api_host: str
+    api_port: int
+    api_key: str
+    api_base_url: str
+    mcp_transport: str
+    mcp_host: str
+    mcp_port: int
+    query_cache_size: int
+    query_cache_ttl: float
+
+
+_MODULE_ATTRS = {
+    "LIGHTRAG_API_HOST": "api_host",
+    "LIGHTRAG_API_PORT": "api_port",
+    "LIGHTRAG_API_KEY": "api_key",
+    "LIGHTRAG_API_BASE_URL": "api_base_url",
+    "MCP_TRANSPORT": "mcp_transport",
+    "MCP_HOST": "mcp_host",
+    "MCP_PORT": "mcp_port",
+    "QUERY_CACHE_SIZE": "query_cache_size",
+    "QUERY_CACHE_TTL": "query_cache_ttl",
+}
+
+
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """Parse configuration once and return it."""
+    args = parse_args()
+    return Settings(
+        api_host=args.host,
+        api_port=args.port,
+        api_key=args.api_key,
+        api_base_url=f"http://{args.host}:{args.port}",
+        mcp_transport=args.transport,
+        mcp_host=args.mcp_host,
+        mcp_port=args.mcp_port,
+        query_cache_size=args.query_cache_size,
+        query_cache_ttl=args.query_cache_ttl,
+    )
 
-args = parse_args()
 
-LIGHTRAG_API_HOST = args.host
-LIGHTRAG_API_PORT = args.port
-LIGHTRAG_API_KEY = args.api_key
-LIGHTRAG_API_BASE_URL = f"http://{LIGHTRAG_API_HOST}:{LIGHTRAG_API_PORT}"
+def __getattr__(name: str) -> Any:
+    if name in _MODULE_ATTRS:
+        return getattr(settings(), _MODULE_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,16 @@
 Client for interacting with LightRAG API.
 """
 
+import asyncio
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+
+import httpx
+import orjson
 
 from lightrag_mcp.client.light_rag_server_api_client.api.default import async_get_health
 from lightrag_mcp.client.light_rag_server_api_client.api.documents import (
@@ -66,30 +72,108 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", covariant=True)
 ApiFunc = Callable[..., Awaitable[Union[T, HTTPValidationError, None]]]
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _OrjsonResponse(httpx.Response):
+    """httpx.Response whose json() decodes the body with orjson."""
+
+    def json(self, **kwargs: Any) -> Any:
+        return orjson.loads(self.content)
+
+
+class _OrjsonAsyncClient(httpx.AsyncClient):
+    """
+    httpx.AsyncClient that encodes and decodes JSON payloads with orjson.
+
+    The generated endpoint modules pass request bodies as json= and parse responses
+    with response.json(), so doing both here keeps the generated code unchanged.
+    """
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        body = kwargs.pop("json", None)
+        if body is not None and kwargs.get("content") is None:
+            kwargs["content"] = orjson.dumps(body)
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+        return super().build_request(method, url, **kwargs)
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        response = await super().send(request, **kwargs)
+        response.__class__ = _OrjsonResponse
+        return response
+
 
 class LightRAGClient:
     """
     Client for interacting with LightRAG API.
     """
 
+    __slots__ = ("base_url", "api_key", "timeout", "headers", "client")
+
     def __init__(
         self,
         base_url: str,
         api_key: str,
+        timeout: Optional[float] = None,
+        pool_size: int = 64,
+        max_connections: int = 128,
+        keepalive_expiry: float = 60.0,
     ):
         """
         Initialize LightRAG API client.
 
+        A single httpx.AsyncClient is created here and shared by all API calls,
+        so keep-alive connections are pooled instead of re-established per request.
+        HTTP/2 is enabled, letting concurrent calls multiplex over one connection
+        when the server supports it. Plain http:// servers get HTTP/1.1 with one
+        connection per in-flight request, so the pool keeps enough idle connections
+        for the server's concurrent tool calls and their fan-out.
+        Failed connection attempts are retried by the transport; requests that
+        reached the server are never re-sent.
+
         Args:
             base_url (str): Base API URL.
             api_key (str): API key (token).
+            timeout (Optional[float]): Request timeout in seconds. Defaults to None (no timeout).
+            pool_size (int): Maximum number of idle keep-alive connections. Defaults to 64.
+            max_connections (int): Maximum number of concurrent connections. Defaults to 128.
+            keepalive_expiry (float): Seconds an idle connection is kept open. Defaults to 60.0.
         """
         self.base_url = base_url
         self.api_key = api_key
+        self.timeout = timeout
+        self.headers = MappingProxyType(
+            {"Authorization": f"Bearer {api_key}"} if api_key and api_key.strip() else {}
+        )
         self.client = AuthenticatedClient(base_url=base_url, token=api_key, verify_ssl=False)
-        logger.info(f"Initialized LightRAG API client: {base_url}")
+        self.client.set_async_httpx_client(
+            _OrjsonAsyncClient(
+                base_url=base_url,
+                headers=self.headers,
+                timeout=timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    verify=False,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=pool_size,
+                        max_connections=max_connections,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                    retries=3,
+                ),
+            )
+        )
+        logger.info("Initialized LightRAG API client: %s", base_url)
+
+    async def __aenter__(self) -> "LightRAGClient":
+        return self
 
-    async def _handle_exception(self, e: Exception, operation_name: str) -> None:
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _handle_exception(self, e: Exception, operation_name: str) -> None:
         """
         Handle exceptions when calling API.
 
@@ -101,9 +185,12 @@ class LightRAGClient:
             Exception: Re-raises the exception
         """
         if isinstance(e, UnexpectedStatus):
-            logger.error(f"HTTP error during {operation_name}: {e.status_code} - {e.content!r}")
+            # Error bodies can be large (e.g. a failed upload); cap the logged repr.
+            logger.error(
+                "HTTP error during %s: %s - %.512r", operation_name, e.status_code, e.content
+            )
         else:
-            logger.error(f"Error during {operation_name}: {str(e)}")
+            logger.error("Error during %s: %s", operation_name, e)
 
     async def _call_api(
         self,
@@ -123,12 +210,12 @@ class LightRAGClient:
             Union[T, HTTPValidationError, None]: API call result
         """
         try:
-            logger.debug(f"Calling API: {operation_name}")
+            logger.debug("Calling API: %s", operation_name)
             result = await api_func(**kwargs)
-            logger.debug(f"API call successful: {operation_name}")
+            logger.debug("API call successful: %s", operation_name)
             return result
         except Exception as e:
-            await self._handle_exception(e, operation_name)
+            self._handle_exception(e, operation_name)
             raise
 
     async def query(
@@ -166,7 +253,7 @@ class LightRAGClient:
         Returns:
             Union[QueryResponse, HTTPValidationError, None]: Query result
         """
-        logger.debug(f"Executing query: {query_text[:100]}...")
+        logger.debug("Executing query: %s...", query_text[:100])
 
         request = QueryRequest(
             query=query_text,
@@ -190,6 +277,145 @@ class LightRAGClient:
             body=request,
         )
 
+    async def query_stream(
+        self,
+        query_text: str,
+        mode: str = "mix",
+        top_k: int = 10,
+        only_need_context: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        history_turns: int = 10,
+    ) -> AsyncIterator[str]:
+        """
+        Execute a streaming query to LightRAG API.
+
+        Args:
+            query_text (str): Query text
+            mode (str, optional): Search mode (global, hybrid, local, mix, naive). Default is "mix".
+            top_k (int, optional): Number of results. Default is 10.
+            only_need_context (bool, optional): Return only context without LLM response. Default is False.
+            response_type (str, optional): Response format. Default is "Multiple Paragraphs".
+            history_turns (int, optional): Number of conversation turns in response context. Default is 10.
+
+        Yields:
+            str: Response text chunks
+        """
+        async for frame in self.query_stream_raw(
+            query_text=query_text,
+            mode=mode,
+            top_k=top_k,
+            only_need_context=only_need_context,
+            response_type=response_type,
+            history_turns=history_turns,
+        ):
+            text = self._parse_stream_frame(frame)
+            if text:
+                yield text
+
+    async def query_stream_raw(
+        self,
+        query_text: str,
+        mode: str = "mix",
+        top_k: int = 10,
+        only_need_context: bool = False,
+        response_type: str = "Multiple Paragraphs",
+        history_turns: int = 10,
+    ) -> AsyncIterator[bytes]:
+        """
+        Execute a streaming query to LightRAG API and yield undecoded frames.
+
+        The response body is split into lines at the byte level; blank lines and
+        heartbeat comments are dropped and the "data: " prefix is stripped, so frames
+        can be forwarded as-is without a decode/encode round-trip.
+
+        Args:
+            query_text (str): Query text
+            mode (str, optional): Search mode (global, hybrid, local, mix, naive). Default is "mix".
+            top_k (int, optional): Number of results. Default is 10.
+            only_need_context (bool, optional): Return only context without LLM response. Default is False.
+            response_type (str, optional): Response format. Default is "Multiple Paragraphs".
+            history_turns (int, optional): Number of conversation turns in response context. Default is 10.
+
+        Yields:
+            bytes: Stream frames, usually JSON objects
+        """
+        logger.debug("Executing streaming query: %s...", query_text[:100])
+
+        request = QueryRequest(
+            query=query_text,
+            mode=QueryRequestMode(mode),
+            response_type=response_type,
+            top_k=top_k,
+            only_need_context=only_need_context,
+            history_turns=history_turns,
+        )
+
+        try:
+            async with self.client.get_async_httpx_client().stream(
+                "POST",
+                "/query/stream",
+                content=orjson.dumps(request.to_dict()),
+                headers=_JSON_HEADERS,
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise UnexpectedStatus(response.status_code, response.content)
+
+                buf = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                    while (nl := buf.find(b"\n")) != -1:
+                        frame = self._stream_frame(bytes(buf[:nl]))
+                        del buf[: nl + 1]
+                        if frame:
+                            yield frame
+                frame = self._stream_frame(bytes(buf))
+                if frame:
+                    yield frame
+        except Exception as e:
+            self._handle_exception(e, "streaming query execution")
+            raise
+
+    @staticmethod
+    def _stream_frame(line: bytes) -> Optional[bytes]:
+        """
+        Extract frame payload from a single line of the /query/stream body.
+
+        Args:
+            line: Raw line without trailing newline
+
+        Returns:
+            Optional[bytes]: Frame payload, or None for blank lines and comments
+        """
+        line = line.rstrip(b"\r")
+        # Lines starting with ":" are SSE comments used as keep-alive heartbeats
+        if not line or line[:1] == b":" or line.isspace():
+            return None
+        if line.startswith(b"data: "):
+            return line[6:]
+        return line
+
+    @staticmethod
+    def _parse_stream_frame(frame: bytes) -> Optional[str]:
+        """
+        Extract response text from a stream frame.
+
+        Args:
+            frame: Frame payload returned by _stream_frame
+
+        Returns:
+            Optional[str]: Response text, or None for non-text frames
+        """
+        try:
+            data = orjson.loads(frame)
+        except orjson.JSONDecodeError:
+            return frame.decode()
+        if not isinstance(data, dict):
+            return None
+        if "error" in data:
+            logger.error("LightRAG stream error: %s", data["error"])
+        return data.get("response")
+
     async def insert_text(
         self,
         text: Union[str, List[str]],
@@ -198,31 +424,110 @@ class LightRAGClient:
         Add text to LightRAG.
 
         Args:
-            text (Union[str, List[str]]): Text or list of texts to add
+            text (Union[str, List[str]]): Text to add. A list of texts is passed on to
+                insert_texts.
 
         Returns:
             Union[InsertResponse, HTTPValidationError]: Operation result
         """
-        logger.debug(f"Adding text: {str(text)[:100]}...")
+        if not isinstance(text, str):
+            return await self.insert_texts(text)
 
-        request: InsertTextRequest | InsertTextsRequest
-        if isinstance(text, str):
-            request = InsertTextRequest(text=text)
-            return await self._call_api(
-                api_func=async_insert_document,
-                operation_name="text insertion",
-                client=self.client,
-                body=request,
-            )
-        else:
-            request = InsertTextsRequest(texts=text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adding text: %s...", text[:100])
+
+        return await self._call_api(
+            api_func=async_insert_document,
+            operation_name="text insertion",
+            client=self.client,
+            body=InsertTextRequest(text=text),
+        )
+
+    async def insert_texts(
+        self, texts: List[str], validate: bool = True
+    ) -> Union[InsertResponse, HTTPValidationError, None]:
+        """
+        Add multiple texts to LightRAG in one request.
+
+        Args:
+            texts (List[str]): Texts to add
+            validate (bool, optional): Build the request through the generated
+                InsertTextsRequest model. Pass False for trusted bulk ingest to
+                serialize the list directly. Default is True.
+
+        Returns:
+            Union[InsertResponse, HTTPValidationError]: Operation result
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adding %s texts: %s...", len(texts), str(texts)[:100])
+
+        if not validate:
             return await self._call_api(
-                api_func=async_insert_texts,
+                api_func=self._insert_texts_fast,
                 operation_name="multiple texts insertion",
-                client=self.client,
-                body=request,
+                texts=texts,
             )
 
+        return await self._call_api(
+            api_func=async_insert_texts,
+            operation_name="multiple texts insertion",
+            client=self.client,
+            body=InsertTextsRequest(texts=texts),
+        )
+
+    async def _insert_texts_fast(
+        self, texts: List[str]
+    ) -> Union[InsertResponse, HTTPValidationError, None]:
+        """POST texts to /documents/texts without going through the generated endpoint."""
+        response = await self.client.get_async_httpx_client().post(
+            "/documents/texts",
+            content=orjson.dumps({"texts": texts}),
+            headers=_JSON_HEADERS,
+        )
+        if response.status_code == 200:
+            return InsertResponse.from_dict(orjson.loads(response.content))
+        if response.status_code == 422:
+            return HTTPValidationError.from_dict(orjson.loads(response.content))
+        if self.client.raise_on_unexpected_status:
+            raise UnexpectedStatus(response.status_code, response.content)
+        return None
+
+    async def insert_texts_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 8,
+        concurrency: int = 8,
+    ) -> List[Union[InsertResponse, HTTPValidationError, None, Exception]]:
+        """
+        Add many texts to LightRAG using concurrent requests.
+
+        Texts are split into batches of batch_size, each sent as one multiple texts
+        insertion; at most concurrency requests are in flight over the shared client.
+        A failing batch does not stop the others: its exception is returned in place
+        of its result.
+
+        Args:
+            texts (List[str]): Texts to add
+            batch_size (int, optional): Number of texts per request. Default is 8.
+            concurrency (int, optional): Maximum number of concurrent requests. Default is 8.
+
+        Returns:
+            List[Union[InsertResponse, HTTPValidationError, None, Exception]]: Result or
+                exception for each batch, in order
+        """
+        logger.debug("Adding %s texts in batches of %s", len(texts), batch_size)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _insert(batch: List[str]) -> Union[InsertResponse, HTTPValidationError, None]:
+            async with semaphore:
+                return await self.insert_texts(batch)
+
+        return await asyncio.gather(
+            *(_insert(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size)),
+            return_exceptions=True,
+        )
+
     async def upload_document(self, file_path: str) -> Union[Any, HTTPValidationError, None]:
         """
         Upload document from file to LightRAG's /input directory and start indexing.
@@ -233,15 +538,13 @@ class LightRAGClient:
         Returns:
             Union[Any, HTTPValidationError]: Operation result.
         """
-        logger.debug(f"Uploading document: {file_path}")
+        logger.debug("Uploading document: %s", file_path)
 
         path = Path(file_path)
-        if not path.exists():
-            logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         try:
-            with open(file_path, "rb") as f:
+            # Opening in a worker thread doubles as the existence check, so the event
+            # loop never blocks on filesystem calls; httpx then streams the file in chunks
+            with await asyncio.to_thread(path.open, "rb") as f:
                 file_name = path.name
                 upload_request = BodyUploadToInputDirDocumentsUploadPost(
                     file=File(payload=f, file_name=file_name)
@@ -254,10 +557,10 @@ class LightRAGClient:
                     body=upload_request,
                 )
         except FileNotFoundError:
-            logger.error(f"Файл не найден: {file_path}")
-            raise
+            logger.error("File not found: %s", file_path)
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except Exception as e:
-            await self._handle_exception(e, f"загрузке файла {file_path}")
+            self._handle_exception(e, f"загрузке файла {file_path}")
             raise
 
     async def insert_file(self, file_path: str) -> Union[InsertResponse, HTTPValidationError, None]:
@@ -270,15 +573,11 @@ class LightRAGClient:
         Returns:
             Union[InsertResponse, HTTPValidationError]: Operation result.
         """
-        logger.debug(f"Adding file: {file_path}")
+        logger.debug("Adding file: %s", file_path)
 
         path = Path(file_path)
-        if not path.exists():
-            logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         try:
-            with open(file_path, "rb") as f:
+            with await asyncio.to_thread(path.open, "rb") as f:
                 file_name = path.name
                 insert_file_request = BodyInsertFileDocumentsFilePost(
                     file=File(payload=f, file_name=file_name)
@@ -291,10 +590,10 @@ class LightRAGClient:
                     body=insert_file_request,
                 )
         except FileNotFoundError:
-            logger.error(f"Файл не найден: {file_path}")
-            raise
+            logger.error("File not found: %s", file_path)
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except Exception as e:
-            await self._handle_exception(e, f"добавлении файла {file_path}")
+            self._handle_exception(e, f"добавлении файла {file_path}")
             raise
 
     async def insert_batch(
@@ -305,6 +604,7 @@ class LightRAGClient:
         include_only: list[str] = [],
         ignore_directories: list[str] = [],
         ignore_files: list[str] = [],
+        concurrency: int = 8,
     ) -> Union[InsertResponse, HTTPValidationError, None]:
         """
         Add batch of documents from directory.
@@ -316,12 +616,16 @@ class LightRAGClient:
             ignore_directories (list[str], optional): List of regexp to exclude directories from batch insertion. Defaults to [].
             ignore_files (list[str], optional): List of regexp to exclude files from batch insertion. Defaults to []. Either ignore_files or include_only must be specified, not both.
             include_only (list[str], optional): List of regexp to specify files to include. Defaults to []. Either include_only or ignore_files must be specified, not both.
+            concurrency (int, optional): Maximum number of files uploaded at the same time. Defaults to 8.
 
         Returns:
             Union[InsertResponse, HTTPValidationError]: Operation result.
         """
         logger.debug(
-            f"Adding batch of documents from directory: {directory_path} (recursive={recursive}, depth={depth})"
+            "Adding batch of documents from directory: %s (recursive=%s, depth=%s)",
+            directory_path,
+            recursive,
+            depth,
         )
 
         if include_only and ignore_files:
@@ -329,11 +633,6 @@ class LightRAGClient:
             logger.error(error_message)
             raise ValueError(error_message)
 
-        dir_path = Path(directory_path)
-        if not dir_path.exists() or not dir_path.is_dir():
-            logger.error(f"Directory not found: {directory_path}")
-            raise FileNotFoundError(f"Directory not found: {directory_path}")
-
         include_patterns = [re.compile(pattern) for pattern in include_only] if include_only else []
         ignore_dir_patterns = (
             [re.compile(pattern) for pattern in ignore_directories] if ignore_directories else []
@@ -342,61 +641,85 @@ class LightRAGClient:
             [re.compile(pattern) for pattern in ignore_files] if ignore_files else []
         )
 
-        def collect_file_paths(dir_path: Path, current_depth: int = 0) -> List[Path]:
+        def collect_file_paths(dir_path: str, current_depth: int = 0) -> List[str]:
             """Recursively collect file paths from directory"""
             file_paths = []
             try:
-                for item in dir_path.iterdir():
-                    if item.is_dir() and recursive and current_depth < depth:
-                        # Check if directory should be ignored
-                        dir_name = item.name
-                        if any(pattern.search(dir_name) for pattern in ignore_dir_patterns):
-                            logger.debug(f"Ignoring directory: {item} (matched ignore pattern)")
-                            continue
-
-                        # Process subdirectory
-                        file_paths.extend(collect_file_paths(item, current_depth + 1))
-                    elif item.is_file():
-                        file_name = item.name
-
-                        # Apply include_only filter if specified
-                        if include_patterns:
-                            if any(pattern.search(file_name) for pattern in include_patterns):
-                                file_paths.append(item)
-                                logger.debug(f"Including file: {item} (matched include pattern)")
-                            else:
+                # DirEntry caches the file type reported by readdir, so classifying
+                # entries does not need a stat call per file.
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and recursive and current_depth < depth:
+                            # Check if directory should be ignored
+                            if any(pattern.search(entry.name) for pattern in ignore_dir_patterns):
                                 logger.debug(
-                                    f"Skipping file: {item} (did not match any include pattern)"
+                                    "Ignoring directory: %s (matched ignore pattern)", entry.path
                                 )
-                            continue
+                                continue
 
-                        # Apply ignore_files filter if specified
-                        if ignore_file_patterns:
-                            if any(pattern.search(file_name) for pattern in ignore_file_patterns):
-                                logger.debug(f"Ignoring file: {item} (matched ignore pattern)")
+                            # Process subdirectory
+                            file_paths.extend(collect_file_paths(entry.path, current_depth + 1))
+                        elif entry.is_file():
+                            file_name = entry.name
+
+                            # Apply include_only filter if specified
+                            if include_patterns:
+                                if any(pattern.search(file_name) for pattern in include_patterns):
+                                    file_paths.append(entry.path)
+                                    logger.debug(
+                                        "Including file: %s (matched include pattern)", entry.path
+                                    )
+                                else:
+                                    logger.debug(
+                                        "Skipping file: %s (did not match any include pattern)",
+                                        entry.path,
+                                    )
                                 continue
 
-                        # If we got here, the file is not filtered out
-                        file_paths.append(item)
+                            # Apply ignore_files filter if specified
+                            if ignore_file_patterns:
+                                if any(
+                                    pattern.search(file_name) for pattern in ignore_file_patterns
+                                ):
+                                    logger.debug(
+                                        "Ignoring file: %s (matched ignore pattern)", entry.path
+                                    )
+                                    continue
+
+                            # If we got here, the file is not filtered out
+                            file_paths.append(entry.path)
             except Exception as e:
-                logger.error(f"Error collecting files from {dir_path}: {str(e)}")
+                logger.error("Error collecting files from %s: %s", dir_path, e)
             return file_paths
 
+        def collect_directory() -> List[str]:
+            """Check the directory and collect its files, all in one worker thread"""
+            if not Path(directory_path).is_dir():
+                logger.error("Directory not found: %s", directory_path)
+                raise FileNotFoundError(f"Directory not found: {directory_path}")
+            return collect_file_paths(directory_path)
+
+        file_paths = await asyncio.to_thread(collect_directory)
         try:
-            file_paths = collect_file_paths(dir_path)
-            logger.info(f"Found {len(file_paths)} files for processing after applying filters")
+            logger.info("Found %s files for processing after applying filters", len(file_paths))
 
-            success_count = 0
-            failed_files = []
+            semaphore = asyncio.Semaphore(concurrency)
 
-            for file_path in file_paths:
-                try:
-                    await self.insert_file(str(file_path))
-                    success_count += 1
-                    logger.debug(f"Successfully inserted file: {file_path}")
-                except Exception as e:
-                    logger.error(f"Error inserting file {file_path}: {str(e)}")
-                    failed_files.append(str(file_path))
+            async def insert_one(file_path: str) -> None:
+                async with semaphore:
+                    await self.insert_file(file_path)
+                logger.debug("Successfully inserted file: %s", file_path)
+
+            # Collect every file's outcome so one failure does not hide the others
+            results = await asyncio.gather(
+                *(insert_one(path) for path in file_paths), return_exceptions=True
+            )
+            failed_files = []
+            for path, result in zip(file_paths, results):
+                if isinstance(result, BaseException):
+                    logger.error("Error inserting file %s: %s", path, result)
+                    failed_files.append(path)
+            success_count = len(file_paths) - len(failed_files)
 
             if success_count == len(file_paths):
                 status = "success"
@@ -416,7 +739,7 @@ class LightRAGClient:
 
             return InsertResponse(status=status, message=message)
         except Exception as e:
-            await self._handle_exception(e, f"inserting batch from {directory_path}")
+            self._handle_exception(e, f"inserting batch from {directory_path}")
             raise
 
     async def scan_for_new_documents(self) -> Union[Any, HTTPValidationError]:
@@ -491,7 +814,7 @@ class LightRAGClient:
         Returns:
             Union[StatusMessageResponse, HTTPValidationError]: Operation result.
         """
-        logger.debug(f"Deleting entity by name: {entity_name}")
+        logger.debug("Deleting entity by name: %s", entity_name)
 
         return await self._call_api(
             api_func=async_delete_entity,
@@ -512,7 +835,7 @@ class LightRAGClient:
         Returns:
             Union[StatusMessageResponse, HTTPValidationError]: Operation result.
         """
-        logger.debug(f"Deleting entities by document ID: {doc_id}")
+        logger.debug("Deleting entities by document ID: %s", doc_id)
 
         return await self._call_api(
             api_func=async_delete_by_doc_id,
@@ -536,7 +859,7 @@ class LightRAGClient:
         Returns:
             Union[EntityResponse, HTTPValidationError]: Created entity.
         """
-        logger.debug(f"Creating entity: {entity_name} (type={entity_type})")
+        logger.debug("Creating entity: %s (type=%s)", entity_name, entity_type)
 
         request = EntityRequest(
             entity_type=entity_type,
@@ -567,7 +890,7 @@ class LightRAGClient:
         Returns:
             Union[EntityResponse, HTTPValidationError]: Updated entity.
         """
-        logger.debug(f"Editing entity: {entity_name}")
+        logger.debug("Editing entity: %s", entity_name)
 
         request = EntityRequest(
             entity_type=entity_type,
@@ -606,7 +929,7 @@ class LightRAGClient:
         Returns:
             Union[relation_response.RelationResponse, HTTPValidationError]: Created relationship.
         """
-        logger.debug(f"Creating relationship: {source} -> {target}")
+        logger.debug("Creating relationship: %s -> %s", source, target)
 
         request = relation_request.RelationRequest(
             description=description,
@@ -645,7 +968,7 @@ class LightRAGClient:
         Returns:
             Union[Dict, HTTPValidationError]: Updated relationship.
         """
-        logger.debug(f"Editing relationship: {source} -> {target}")
+        logger.debug("Editing relationship: %s -> %s", source, target)
 
         request = relation_request.RelationRequest(
             description=description,
@@ -683,7 +1006,7 @@ class LightRAGClient:
         Returns:
             Union[Dict, HTTPValidationError]: Merge operation result.
         """
-        logger.debug(f"Merging entities: {', '.join(source_entities)} -> {target_entity}")
+        logger.debug("Merging entities: %s -> %s", source_entities, target_entity)
 
         request = MergeEntitiesRequest(
             source_entities=source_entities,
@@ -712,7 +1035,56 @@ class LightRAGClient:
             client=self.client,
         )
 
+    async def warm_up(self) -> None:
+        """
+        Open a pooled connection to the LightRAG API ahead of the first tool call.
+
+        Sends a health request and ignores its outcome, so connection setup and the
+        lazy HTTP/2 imports are paid once at startup instead of by the first caller.
+        """
+        try:
+            await self.client.get_async_httpx_client().get("/health")
+        except httpx.HTTPError as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        # Read the attribute directly: get_async_httpx_client() would build a fresh
+        # client just to close it if none had been set.
+        async_client = getattr(self.client, "_async_client", None)
+        if async_client is not None:
+            await async_client.aclose()
+        logger.info("LightRAG API client closed.")
+
     async def close(self):
         """Close HTTP client."""
-        await self.client.get_async_httpx_client().aclose()
-        logger.info("LightRAG API client closed.")
+        await self.aclose()
+
+
+_default_client: Optional[LightRAGClient] = None
+
+
+def get_default_client() -> LightRAGClient:
+    """
+    Get process-wide LightRAG API client, creating it on first use.
+
+    Returns:
+        LightRAGClient: Shared client configured from command line arguments.
+    """
+    global _default_client
+    if _default_client is None:
+        from lightrag_mcp import config
+
+        _default_client = LightRAGClient(
+            base_url=config.LIGHTRAG_API_BASE_URL,
+            api_key=config.LIGHTRAG_API_KEY,
+        )
+    return _default_client
+
+
+async def close_default_client() -> None:
+    """Close process-wide LightRAG API client if it was created."""
+    global _default_client
+    if _default_client is not None:
+        await _default_client.aclose()
+        _default_client = None
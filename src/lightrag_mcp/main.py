@@ -6,7 +6,6 @@ import logging
 import sys
 
 from lightrag_mcp import config
-from lightrag_mcp.server import mcp
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,19 +25,32 @@ def main():
 
         logger.info("Starting LightRAG MCP server")
         logger.info(
-            f"LightRAG API server is expected to be already running and available at: {config.LIGHTRAG_API_BASE_URL}"
+            "LightRAG API server is expected to be already running and available at: %s",
+            config.LIGHTRAG_API_BASE_URL,
         )
         if config.LIGHTRAG_API_KEY:
             logger.info("API key is configured")
         else:
             logger.warning("No API key provided")
 
-        mcp.run(transport="stdio")
+        # Imported after configuration is parsed so --help and argument errors
+        # do not pay for loading the MCP server and the generated client.
+        from lightrag_mcp.server import mcp
+
+        if config.MCP_TRANSPORT != "stdio":
+            logger.info(
+                "Serving MCP over %s at %s:%s",
+                config.MCP_TRANSPORT,
+                config.MCP_HOST,
+                config.MCP_PORT,
+            )
+
+        mcp.run(transport=config.MCP_TRANSPORT)
 
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.exception(f"Error starting server: {str(e)}")
+        logger.exception("Error starting server: %s", e)
         sys.exit(1)
 
 
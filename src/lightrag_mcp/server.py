@@ -3,53 +3,123 @@ Main module for LightRAG MCP server.
 """
 
 import asyncio
+import inspect
 import logging
+import time
+from collections import OrderedDict, deque
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Union, cast
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 
 from lightrag_mcp import config
-from lightrag_mcp.lightrag_client import LightRAGClient
+from lightrag_mcp.client.light_rag_server_api_client.models import (
+    HTTPValidationError,
+    InsertResponse,
+    PipelineStatusResponse,
+    QueryResponse,
+)
+from lightrag_mcp.lightrag_client import (
+    LightRAGClient,
+    close_default_client,
+    get_default_client,
+)
 
 logger = logging.getLogger(__name__)
 
-mcp = FastMCP("LightRAG MCP Server")
 
+# Response envelopes; copying a prebuilt dict reuses its key table instead of rebuilding it
+_SUCCESS_RESPONSE: Dict[str, Any] = {"status": "success", "response": None}
+_ERROR_RESPONSE: Dict[str, Any] = {"status": "error", "error": None}
 
-def format_response(result: Any, is_error: bool = False) -> Dict[str, Any]:
+
+def _is_failed_result(result: Any) -> bool:
     """
-    Formats response in standard format.
+    Checks whether a LightRAG API call failed without raising.
+
+    The generated client returns HTTPValidationError for 422 responses and None for
+    other unexpected statuses instead of raising an exception.
 
     Args:
         result: Operation result
-        is_error: Error flag
 
     Returns:
-        Dict[str, Any]: Standardized response
+        bool: True if the result is None or an HTTPValidationError
     """
-    if is_error:
-        if isinstance(result, str):
-            return {"status": "error", "error": result}
-        return {"status": "error", "error": str(result)}
+    return result is None or isinstance(result, HTTPValidationError)
 
+
+def _identity(result: Any) -> Any:
+    return result
+
+
+@lru_cache(maxsize=256)
+def _response_serializer(result_type: type) -> Callable[[Any], Any]:
+    """
+    Picks the conversion used by format_response for instances of a type.
+
+    Args:
+        result_type: Type of the operation result
+
+    Returns:
+        Callable[[Any], Any]: Function converting a result to a response payload
+    """
     # If result is already a dictionary, return it wrapped
-    if isinstance(result, dict):
-        return {"status": "success", "response": result}
+    if issubclass(result_type, dict):
+        return _identity
 
     # If result has dict() method or __dict__, use it
-    if hasattr(result, "dict") and callable(getattr(result, "dict")):
-        return {"status": "success", "response": result.dict()}
-    if hasattr(result, "__dict__"):
-        return {"status": "success", "response": result.__dict__}
-    if hasattr(result, "to_dict") and callable(getattr(result, "to_dict")):
-        return {"status": "success", "response": result.to_dict()}
+    if callable(getattr(result_type, "dict", None)):
+        return methodcaller("dict")
+    if result_type.__dictoffset__:
+        return attrgetter("__dict__")
+    if callable(getattr(result_type, "to_dict", None)):
+        return methodcaller("to_dict")
 
     # In other cases, convert to string
-    return {"status": "success", "response": str(result)}
+    return str
+
+
+def format_response(result: Any, is_error: bool = False) -> Dict[str, Any]:
+    """
+    Formats response in standard format.
+
+    Args:
+        result: Operation result
+        is_error: Error flag
+
+    Returns:
+        Dict[str, Any]: Standardized response
+    """
+    if is_error:
+        response = _ERROR_RESPONSE.copy()
+        response["error"] = result if type(result) is str else str(result)
+        return response
+
+    if result is None:
+        return format_response("No response from LightRAG API", is_error=True)
+    if isinstance(result, HTTPValidationError):
+        response = _ERROR_RESPONSE.copy()
+        response["error"] = result.to_dict()
+        return response
+
+    response = _SUCCESS_RESPONSE.copy()
+    # Plain dicts are the most common result and skip the serializer lookup
+    if type(result) is dict:
+        # Results that are already a response envelope are passed through unchanged
+        if "status" in result and "response" in result:
+            return result
+        response["response"] = result
+    else:
+        response["response"] = _response_serializer(type(result))(result)
+    return response
 
 
 @dataclass
@@ -59,75 +129,355 @@ class AppContext:
     lightrag_client: LightRAGClient
 
 
+# Number of lifespans using the shared client; sse and streamable-http run one per session
+_active_lifespans = 0
+
+
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """
     Manages application lifecycle with typed context.
-    Initializes LightRAG API client at startup and closes it at shutdown.
+    Initializes LightRAG API client at startup, warms its connection pool and
+    closes it when the last session using it ends.
     """
-    lightrag_client = LightRAGClient(
-        base_url=config.LIGHTRAG_API_BASE_URL,
-        api_key=config.LIGHTRAG_API_KEY,
-    )
+    global _active_lifespans
+    lightrag_client = get_default_client()
+    _active_lifespans += 1
+    # Warm the connection pool in the background so startup is not delayed
+    warm_up = asyncio.create_task(lightrag_client.warm_up()) if _active_lifespans == 1 else None
 
     try:
         yield AppContext(lightrag_client=lightrag_client)
     finally:
-        await lightrag_client.close()
-        logger.info("LightRAG MCP Server stopped")
+        if warm_up is not None:
+            warm_up.cancel()
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            # Jobs use the shared client, so they must not outlive it
+            await _cancel_jobs()
+            await close_default_client()
+            logger.info("LightRAG MCP Server stopped")
+
+
+# host and port must be known at construction: FastMCP derives its DNS rebinding
+# protection (localhost-only Host headers) from them there
+mcp = FastMCP(
+    "LightRAG MCP Server",
+    lifespan=app_lifespan,
+    host=config.MCP_HOST,
+    port=config.MCP_PORT,
+)
+
+
+# Short-lived results of read-only operations: key -> (expiry time, result)
+_read_cache: Dict[str, Tuple[float, Any]] = {}
+_read_cache_generation = 0
+# Read requests currently in flight, shared by concurrent callers with the same key
+_read_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+# query_document results keyed by query parameters, least recently used first
+_query_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+# Set by writes: LightRAG indexes in the background, so answers may change until its
+# pipeline reports idle
+_pipeline_maybe_busy = True
+
+
+def _invalidate_read_cache() -> None:
+    """Drops cached read results after an operation that may change LightRAG state."""
+    global _read_cache_generation, _pipeline_maybe_busy
+    _read_cache_generation += 1
+    _pipeline_maybe_busy = True
+    _read_cache.clear()
+    _read_inflight.clear()
+    _query_cache.clear()
+
+
+def _cached_operation(key: str, ttl: float, operation_func: Callable) -> Callable:
+    """
+    Wraps a read-only operation so its result is reused for ttl seconds and
+    concurrent calls made while it is running share a single request.
+
+    Args:
+        key: Cache key
+        ttl: Time in seconds the result stays valid
+        operation_func: Function to execute that takes client as first argument
+
+    Returns:
+        Callable: Operation function with caching
+    """
+
+    async def operation(client: LightRAGClient) -> Any:
+        entry = _read_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        # Concurrent misses share one request; shield it so a cancelled caller
+        # does not cancel it for the others
+        task = _read_inflight.get(key)
+        if task is None:
+            task = _read_inflight[key] = asyncio.ensure_future(fetch(client))
+        return await asyncio.shield(task)
+
+    async def fetch(client: LightRAGClient) -> Any:
+        generation = _read_cache_generation
+        try:
+            result = await operation_func(client)
+        finally:
+            # A write may have dropped this request and let a newer one take its place
+            if _read_inflight.get(key) is asyncio.current_task():
+                del _read_inflight[key]
+        # Do not store failures, or a result that may predate a write finished in the meantime
+        if generation == _read_cache_generation and not _is_failed_result(result):
+            _read_cache[key] = (time.monotonic() + ttl, result)
+        return result
+
+    return operation
+
+
+async def _cached_query(client: LightRAGClient, **kwargs: Any) -> Any:
+    """
+    Executes a query, reusing the result of an identical earlier query.
+
+    Results stay valid for config.QUERY_CACHE_TTL seconds and are dropped when an
+    operation changes LightRAG state. Results are not stored while the LightRAG
+    pipeline may still be indexing documents added by such an operation.
+
+    Args:
+        client: LightRAG API client
+        **kwargs: Arguments for LightRAGClient.query
+
+    Returns:
+        Any: Query result
+    """
+    ttl = config.QUERY_CACHE_TTL
+    if ttl <= 0:
+        return await client.query(**kwargs)
+
+    key = tuple(
+        (name, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items()
+    )
+    entry = _query_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _query_cache.move_to_end(key)
+        return entry[1]
+
+    generation = _read_cache_generation
+    result = await client.query(**kwargs)
+    # Only successful answers are reused, and only if no write finished in the meantime
+    if not isinstance(result, QueryResponse) or generation != _read_cache_generation:
+        return result
+    if _pipeline_maybe_busy and not await _pipeline_idle(client, generation):
+        return result
+    if generation == _read_cache_generation:
+        _query_cache[key] = (time.monotonic() + ttl, result)
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > config.QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return result
 
 
-mcp = FastMCP("LightRAG MCP Server", lifespan=app_lifespan)
+# Failure timestamps per session and operation; a full window means the caller is retrying
+# in a loop. Sessions are weakly referenced so their entries go away with them.
+_LOOP_FAILURES = 5
+_LOOP_WINDOW = 10.0
+_recent_failures: "WeakKeyDictionary[Any, Dict[str, deque[float]]]" = WeakKeyDictionary()
+
+
+def _is_looping(failures: "deque[float]", now: float) -> bool:
+    """
+    Checks whether an operation keeps failing for the same session.
+
+    Args:
+        failures: Recent failure timestamps of the operation
+        now: Current monotonic time
+
+    Returns:
+        bool: True if the last _LOOP_FAILURES calls failed within _LOOP_WINDOW seconds
+            and the latest failure is still within the window
+    """
+    return (
+        len(failures) == _LOOP_FAILURES
+        and failures[-1] - failures[0] < _LOOP_WINDOW
+        and now - failures[-1] < _LOOP_WINDOW
+    )
+
+
+def _record_failure(session_failures: Dict[str, "deque[float]"], loop_operation: str) -> bool:
+    """
+    Records a failed call of an operation for a session.
+
+    Args:
+        session_failures: Failure timestamps of the session, keyed by operation
+        loop_operation: Operation the failure belongs to
+
+    Returns:
+        bool: True if the operation is now failing in a loop
+    """
+    now = time.monotonic()
+    failures = session_failures.get(loop_operation)
+    # Failures older than the window say nothing about a loop; start over
+    if failures is None or now - failures[-1] >= _LOOP_WINDOW:
+        failures = session_failures[loop_operation] = deque(maxlen=_LOOP_FAILURES)
+    failures.append(now)
+    return _is_looping(failures, now)
+
+
+def _loop_response(operation_name: str) -> Dict[str, Any]:
+    response = format_response(
+        f"Loop detected: {operation_name} failed {_LOOP_FAILURES} times in a row, stop retrying",
+        is_error=True,
+    )
+    response["abort"] = True
+    return response
+
+
+async def _pipeline_idle(client: LightRAGClient, generation: int) -> bool:
+    """
+    Checks whether LightRAG has finished indexing, clearing _pipeline_maybe_busy if so.
+
+    Args:
+        client: LightRAG API client
+        generation: Read cache generation the caller's result belongs to
+
+    Returns:
+        bool: True if the pipeline reported it is not busy
+    """
+    global _pipeline_maybe_busy
+    try:
+        status = await client.get_pipeline_status()
+    except Exception:
+        return False
+    if not isinstance(status, PipelineStatusResponse) or status.busy is True:
+        return False
+    # A write that started while the status was requested keeps the flag set
+    if generation == _read_cache_generation:
+        _pipeline_maybe_busy = False
+    return True
+
+
+# Concurrency limits for tool handlers. File uploads get their own, smaller limit so long
+# transfers cannot occupy every slot and starve queries and status calls.
+_OPERATION_LIMIT = asyncio.Semaphore(32)
+_FILE_OPERATION_LIMIT = asyncio.Semaphore(4)
 
 
 async def execute_lightrag_operation(
-    operation_name: str, operation_func: Callable, ctx: Context
+    operation_name: str,
+    operation_func: Callable,
+    ctx: Context,
+    limit: asyncio.Semaphore = _OPERATION_LIMIT,
+    invalidates_cache: bool = False,
+    kwargs: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Universal wrapper function for executing operations with LightRAG API.
 
     Automatically handles:
     - Getting client from context
-    - Type casting
     - Exception handling
     - Response formatting
 
     Args:
         operation_name: Operation name for logging
         operation_func: Function to execute that takes client as first argument
+        limit: Semaphore bounding how many operations of this kind run at once
+        invalidates_cache: Whether the operation may change data served from the read cache
+        kwargs: Keyword arguments passed to operation_func after the client, so tools can
+            hand over an unbound LightRAGClient method instead of building a closure per call
 
     Returns:
         Dict[str, Any]: Formatted response
     """
+    session_failures: Optional[Dict[str, "deque[float]"]] = None
+    # Operation names carry call details after the colon; the prefix identifies the tool
+    loop_operation = operation_name.partition(":")[0]
     try:
         if not ctx or not ctx.request_context or not ctx.request_context.lifespan_context:
             return format_response(
                 f"Error: Request context is not available for {operation_name}", is_error=True
             )
 
-        app_ctx = cast(AppContext, ctx.request_context.lifespan_context)
+        # lifespan_context is typed as Any on a bare Context; annotate instead of cast()
+        app_ctx: AppContext = ctx.request_context.lifespan_context
         client = app_ctx.lightrag_client
 
-        logger.info(f"Executing operation: {operation_name}")
-        result = await operation_func(client)
-
+        session_failures = _recent_failures.setdefault(ctx.request_context.session, {})
+        failures = session_failures.get(loop_operation)
+        if failures is not None and _is_looping(failures, time.monotonic()):
+            logger.warning("Refusing %s: repeated failures", operation_name)
+            return _loop_response(operation_name)
+
+        logger.info("Executing operation: %s", operation_name)
+        async with limit:
+            try:
+                if kwargs:
+                    result = await operation_func(client, **kwargs)
+                else:
+                    result = await operation_func(client)
+            finally:
+                if invalidates_cache:
+                    _invalidate_read_cache()
+
+        # HTTP errors come back as results rather than exceptions and count as failures too
+        if _is_failed_result(result):
+            logger.error("Error during %s: %s", operation_name, result)
+            if _record_failure(session_failures, loop_operation):
+                return _loop_response(operation_name)
+        elif failures is not None:
+            session_failures.pop(loop_operation, None)
         return format_response(result)
     except Exception as e:
-        logger.exception(f"Error during {operation_name}: {str(e)}")
+        logger.exception("Error during %s: %s", operation_name, e)
+        if session_failures is not None and _record_failure(session_failures, loop_operation):
+            return _loop_response(operation_name)
         return format_response(str(e), is_error=True)
 
 
+# Operations started with background=True, keyed by job ID
+_jobs: Dict[str, asyncio.Task] = {}
+# Seconds a finished job's result is kept for poll_job
+_JOB_RESULT_TTL = 3600.0
+
+
+def _start_job(operation: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Runs an operation in the background and returns its job ID for poll_job.
+
+    Args:
+        operation: Coroutine returning a formatted response
+
+    Returns:
+        Dict[str, Any]: Pending status with job ID
+    """
+    job_id = uuid4().hex
+    task = _jobs[job_id] = asyncio.ensure_future(operation)
+    # Results that are never polled are dropped after _JOB_RESULT_TTL
+    task.add_done_callback(
+        lambda _: asyncio.get_running_loop().call_later(_JOB_RESULT_TTL, _jobs.pop, job_id, None)
+    )
+    return {"status": "pending", "job_id": job_id}
+
+
+async def _cancel_jobs() -> None:
+    """Cancels background jobs that are still running and waits for them to finish."""
+    tasks = list(_jobs.values())
+    _jobs.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # === MCP Tools ===
 
+# Values of QueryRequestMode; a Literal puts them into the tool schema and lets
+# argument validation reject unknown modes before any work is done
+QueryMode = Literal["mix", "global", "hybrid", "local", "naive"]
+
 
 @mcp.tool(name="query_document", description="Execute a query to documents through LightRAG API")
 async def query_document(
     ctx: Context,
     query: str = Field(description="Query text"),
-    mode: str = Field(
-        description="Search mode (mix, semantic, keyword, global, hybrid, local, naive)",
-        default="mix",
-    ),
+    mode: QueryMode = Field(description="Search mode", default="mix"),
     top_k: int = Field(description="Number of results", default=60),
     only_need_context: bool = Field(
         description="Return only context without LLM response", default=False
@@ -137,7 +487,7 @@ async def query_document(
         default=False,
     ),
     response_type: str = Field(
-        description="Определяет формат ответа. Примеры: 'Multiple Paragraphs', 'Single Paragraph', 'Bullet Points'",
+        description="Response format: 'Multiple Paragraphs', 'Single Paragraph', 'Bullet Points'",
         default="Multiple Paragraphs",
     ),
     max_token_for_text_unit: int = Field(
@@ -150,51 +500,121 @@ async def query_document(
         description="Maximum tokens for local context", default=4096
     ),
     hl_keywords: list[str] = Field(
-        description="List of high-level keywords for prioritization", default=[]
+        description="List of high-level keywords for prioritization", default_factory=list
     ),
     ll_keywords: list[str] = Field(
-        description="List of low-level keywords for search refinement", default=[]
+        description="List of low-level keywords for search refinement", default_factory=list
     ),
     history_turns: int = Field(
         description="Number of conversation turns in response context", default=10
     ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.query(
-            query_text=query,
-            mode=mode,
-            top_k=top_k,
-            only_need_context=only_need_context,
-            only_need_prompt=only_need_prompt,
-            response_type=response_type,
-            max_token_for_text_unit=max_token_for_text_unit,
-            max_token_for_global_context=max_token_for_global_context,
-            max_token_for_local_context=max_token_for_local_context,
-            hl_keywords=hl_keywords,
-            ll_keywords=ll_keywords,
-            history_turns=history_turns,
-        )
-
     return await execute_lightrag_operation(
         operation_name=f"query execution: {query[:50]}...",
-        operation_func=_operation,
+        operation_func=_cached_query,
+        kwargs={
+            "query_text": query,
+            "mode": mode,
+            "top_k": top_k,
+            "only_need_context": only_need_context,
+            "only_need_prompt": only_need_prompt,
+            "response_type": response_type,
+            "max_token_for_text_unit": max_token_for_text_unit,
+            "max_token_for_global_context": max_token_for_global_context,
+            "max_token_for_local_context": max_token_for_local_context,
+            "hl_keywords": hl_keywords,
+            "ll_keywords": ll_keywords,
+            "history_turns": history_turns,
+        },
         ctx=ctx,
     )
 
 
+# Lists longer than this are split into shards inserted by concurrent requests
+_INSERT_SHARD_SIZE = 8
+_INSERT_CONCURRENCY = 4
+
+
+async def _insert_text_shards(client: LightRAGClient, texts: List[str]) -> Dict[str, Any]:
+    """
+    Inserts texts in shards of _INSERT_SHARD_SIZE over concurrent requests.
+
+    Args:
+        client: LightRAG API client
+        texts: Texts to add
+
+    Returns:
+        Dict[str, Any]: Combined status, message and per-shard results
+    """
+    results = await client.insert_texts_batch(
+        texts, batch_size=_INSERT_SHARD_SIZE, concurrency=_INSERT_CONCURRENCY
+    )
+    shards = [_shard_result(index, result) for index, result in enumerate(results)]
+    successful = sum(1 for shard in shards if shard["status"] == "success")
+
+    if successful == len(shards):
+        status = "success"
+    elif successful > 0:
+        status = "partial_success"
+    else:
+        status = "failure"
+
+    return {
+        "status": status,
+        "message": f"{successful} of {len(shards)} shards of {len(texts)} texts inserted",
+        "results": shards,
+    }
+
+
+def _shard_result(index: int, result: Any) -> Dict[str, Any]:
+    """
+    Reports the outcome of one insert_document shard.
+
+    Args:
+        index: Shard number, counting from 0
+        result: InsertResponse, other API result or exception returned for the shard
+
+    Returns:
+        Dict[str, Any]: Shard number with success status and response, or error status and error
+    """
+    if isinstance(result, InsertResponse) and result.status != "failure":
+        return {"shard": index, "status": "success", "response": result.to_dict()}
+
+    if isinstance(result, BaseException):
+        error: Any = str(result) or type(result).__name__
+    elif result is None:
+        error = "No response from LightRAG API"
+    else:
+        error = _response_serializer(type(result))(result)
+    return {"shard": index, "status": "error", "error": error}
+
+
 @mcp.tool(name="insert_document", description="Add text directly to LightRAG storage")
 async def insert_document(
     ctx: Context,
     text: Union[str, List[str]] = Field(description="Text or list of texts to add"),
+    background: bool = Field(
+        description="Return a job ID immediately and run in the background; check it with poll_job",
+        default=False,
+    ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.insert_text(text=text)
-
-    return await execute_lightrag_operation(
+    if isinstance(text, str):
+        operation_func, kwargs = LightRAGClient.insert_text, {"text": text}
+    elif len(text) > _INSERT_SHARD_SIZE:
+        operation_func, kwargs = _insert_text_shards, {"texts": text}
+    else:
+        operation_func, kwargs = LightRAGClient.insert_texts, {"texts": text}
+
+    operation = execute_lightrag_operation(
         operation_name="text insertion",
-        operation_func=_operation,
+        operation_func=operation_func,
+        kwargs=kwargs,
         ctx=ctx,
+        invalidates_cache=True,
     )
+    if background:
+        return _start_job(operation)
+    return await operation
 
 
 @mcp.tool(
@@ -204,30 +624,44 @@ async def insert_document(
 async def upload_document(
     ctx: Context,
     file_path: str = Field(description="Path to file for upload"),
+    background: bool = Field(
+        description="Return a job ID immediately and run in the background; check it with poll_job",
+        default=False,
+    ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.upload_document(file_path=file_path)
-
-    return await execute_lightrag_operation(
+    operation = execute_lightrag_operation(
         operation_name=f"file upload: {file_path}",
-        operation_func=_operation,
+        operation_func=LightRAGClient.upload_document,
+        kwargs={"file_path": file_path},
         ctx=ctx,
+        limit=_FILE_OPERATION_LIMIT,
+        invalidates_cache=True,
     )
+    if background:
+        return _start_job(operation)
+    return await operation
 
 
 @mcp.tool(name="insert_file", description="Add document from file to LightRAG")
 async def insert_file(
     ctx: Context,
     file_path: str = Field(description="Path to file for upload"),
+    background: bool = Field(
+        description="Return a job ID immediately and run in the background; check it with poll_job",
+        default=False,
+    ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.insert_file(file_path=file_path)
-
-    return await execute_lightrag_operation(
+    operation = execute_lightrag_operation(
         operation_name=f"file insertion: {file_path}",
-        operation_func=_operation,
+        operation_func=LightRAGClient.insert_file,
+        kwargs={"file_path": file_path},
         ctx=ctx,
+        limit=_FILE_OPERATION_LIMIT,
+        invalidates_cache=True,
     )
+    if background:
+        return _start_job(operation)
+    return await operation
 
 
 @mcp.tool(name="insert_batch", description="Add batch of documents from directory to LightRAG")
@@ -237,98 +671,142 @@ async def insert_batch(
     recursive: bool = Field(description="Recursive addition. Defaults to False", default=False),
     depth: int = Field(description="Recursion depth. Defaults to 1", default=1),
     include_only: list[str] = Field(
-        description="""
-        List of regexp to specify files to include. 
-        Files not matching any regexp will be skipped. 
-        Defaults to [] (all files). 
-        Either include_only or ignore_files must be specified, not both.
-        """,
-        default=[],
+        description=(
+            "Regexps of file names to include; other files are skipped. "
+            "Defaults to all files. Do not combine with ignore_files"
+        ),
+        default_factory=list,
     ),
     ignore_files: list[str] = Field(
-        description="""
-        List of regexp to exclude files from batch insertion.
-        Defaults to [] (no files are excluded).
-        Either ignore_files or include_only must be specified, not both.
-        """,
-        default=[],
+        description=(
+            "Regexps of file names to skip. Defaults to none. Do not combine with include_only"
+        ),
+        default_factory=list,
     ),
     ignore_directories: list[str] = Field(
-        description="""
-        List of regexp to exclude directories from batch insertion.
-        Defaults to [] (no directories are excluded).
-        """,
-        default=[],
+        description="Regexps of directory names to skip. Defaults to none",
+        default_factory=list,
+    ),
+    background: bool = Field(
+        description="Return a job ID immediately and run in the background; check it with poll_job",
+        default=False,
     ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.insert_batch(
-            directory_path=directory_path,
-            recursive=recursive,
-            depth=depth,
-            include_only=include_only,
-            ignore_directories=ignore_directories,
-            ignore_files=ignore_files,
-        )
-
-    return await execute_lightrag_operation(
+    operation = execute_lightrag_operation(
         operation_name=f"batch insertion from directory: {directory_path}",
-        operation_func=_operation,
-        ctx=ctx,
-    )
-
-
-@mcp.tool(
-    name="scan_for_new_documents",
-    description="Start scanning LightRAG /inputs directory for new documents",
-)
-async def scan_for_new_documents(ctx: Context) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.scan_for_new_documents()
-
-    return await execute_lightrag_operation(
-        operation_name="scanning for new documents",
-        operation_func=_operation,
+        operation_func=LightRAGClient.insert_batch,
+        kwargs={
+            "directory_path": directory_path,
+            "recursive": recursive,
+            "depth": depth,
+            "include_only": include_only,
+            "ignore_directories": ignore_directories,
+            "ignore_files": ignore_files,
+        },
         ctx=ctx,
+        limit=_FILE_OPERATION_LIMIT,
+        invalidates_cache=True,
     )
+    if background:
+        return _start_job(operation)
+    return await operation
 
 
-@mcp.tool(name="get_documents", description="Get list of all uploaded documents")
-async def get_documents(ctx: Context) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.get_documents()
+@mcp.tool(name="poll_job", description="Get status or result of a background operation")
+async def poll_job(
+    ctx: Context,
+    job_id: str = Field(description="Job ID returned by an operation started with background=True"),
+) -> Dict[str, Any]:
+    task = _jobs.get(job_id)
+    if task is None:
+        return format_response(f"Unknown job: {job_id}", is_error=True)
+    if not task.done():
+        return {"status": "running", "job_id": job_id}
+
+    # Finished jobs are handed out once
+    del _jobs[job_id]
+    if task.cancelled():
+        return format_response(f"Job {job_id} was cancelled", is_error=True)
+    return task.result()
+
+
+# Tools without parameters that forward to a LightRAGClient method:
+# (tool name, description, client method, operation name for logging,
+#  seconds to serve the result from the read cache or None to always call the API,
+#  whether the operation changes LightRAG state and so invalidates cached reads)
+_SIMPLE_TOOLS: List[Tuple[str, str, Callable, str, Optional[float], bool]] = [
+    (
+        "scan_for_new_documents",
+        "Start scanning LightRAG /inputs directory for new documents",
+        LightRAGClient.scan_for_new_documents,
+        "scanning for new documents",
+        None,
+        True,
+    ),
+    (
+        "get_documents",
+        "Get list of all uploaded documents",
+        LightRAGClient.get_documents,
+        "getting documents list",
+        10.0,
+        False,
+    ),
+    (
+        "get_pipeline_status",
+        "Get status of document processing in pipeline",
+        LightRAGClient.get_pipeline_status,
+        "getting pipeline status",
+        None,
+        False,
+    ),
+    (
+        "get_graph_labels",
+        "Get labels (node and relationship types) from knowledge graph",
+        LightRAGClient.get_graph_labels,
+        "getting graph labels",
+        30.0,
+        False,
+    ),
+]
 
-    return await execute_lightrag_operation(
-        operation_name="getting documents list",
-        operation_func=_operation,
-        ctx=ctx,
-    )
 
+def _make_simple_tool(
+    name: str,
+    method: Callable[[LightRAGClient], Awaitable[Any]],
+    operation_name: str,
+    cache_ttl: Optional[float] = None,
+    invalidates_cache: bool = False,
+) -> Callable[[Context], Awaitable[Dict[str, Any]]]:
+    """
+    Builds a tool handler that calls a LightRAGClient method without arguments.
 
-@mcp.tool(name="get_pipeline_status", description="Get status of document processing in pipeline")
-async def get_pipeline_status(ctx: Context) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.get_pipeline_status()
+    Args:
+        name: Tool name
+        method: Unbound LightRAGClient method
+        operation_name: Operation name for logging
+        cache_ttl: Seconds to reuse the result, or None to disable caching
+        invalidates_cache: Whether the operation may change data served from the read cache
 
-    return await execute_lightrag_operation(
-        operation_name="getting pipeline status",
-        operation_func=_operation,
-        ctx=ctx,
-    )
+    Returns:
+        Callable[[Context], Awaitable[Dict[str, Any]]]: Tool handler
+    """
+    operation_func = method if cache_ttl is None else _cached_operation(name, cache_ttl, method)
+
+    async def tool(ctx: Context) -> Dict[str, Any]:
+        return await execute_lightrag_operation(
+            operation_name=operation_name,
+            operation_func=operation_func,
+            ctx=ctx,
+            invalidates_cache=invalidates_cache,
+        )
 
+    tool.__name__ = tool.__qualname__ = name
+    return tool
 
-@mcp.tool(
-    name="get_graph_labels",
-    description="Get labels (node and relationship types) from knowledge graph",
-)
-async def get_graph_labels(ctx: Context) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.get_graph_labels()
 
-    return await execute_lightrag_operation(
-        operation_name="getting graph labels",
-        operation_func=_operation,
-        ctx=ctx,
+for _name, _description, _method, _operation_name, _cache_ttl, _invalidates in _SIMPLE_TOOLS:
+    mcp.tool(name=_name, description=_description)(
+        _make_simple_tool(_name, _method, _operation_name, _cache_ttl, _invalidates)
     )
 
 
@@ -337,12 +815,12 @@ async def check_lightrag_health(ctx: Context) -> Dict[str, Any]:
     async def _operation(client: LightRAGClient) -> Any:
         result = await client.get_health()
         if isinstance(result, dict) and "status" in result:
-            logger.info(f"LightRAG API returned status: {result['status']}")
+            logger.info("LightRAG API returned status: %s", result["status"])
         return result
 
     return await execute_lightrag_operation(
         operation_name="health check",
-        operation_func=_operation,
+        operation_func=_cached_operation("check_lightrag_health", 5.0, _operation),
         ctx=ctx,
     )
 
@@ -356,21 +834,24 @@ async def merge_entities(
     source_entities: List[str] = Field(description="List of entity names to merge"),
     target_entity: str = Field(description="Target entity name"),
     merge_strategy: Dict[str, str] = Field(
-        description="Property merge strategy. Supported strategies: 'concatenate' (concatenate text values), 'keep_first' (keep first non-empty value), 'keep_last' (keep last non-empty value), 'join_unique' (join unique values for delimited fields). Example: {'description': 'concatenate', 'entity_type': 'keep_first'}",
+        description=(
+            "Strategy per property: concatenate, keep_first, keep_last (first/last non-empty "
+            "value) or join_unique (unique values of delimited fields). "
+            "Example: {'description': 'concatenate', 'entity_type': 'keep_first'}"
+        ),
         default_factory=dict,
     ),
 ) -> Dict[str, Any]:
-    async def _operation(client: LightRAGClient) -> Any:
-        return await client.merge_entities(
-            source_entities=source_entities,
-            target_entity=target_entity,
-            merge_strategy=merge_strategy,
-        )
-
     return await execute_lightrag_operation(
         operation_name=f"entity merging: {', '.join(source_entities)} -> {target_entity}",
-        operation_func=_operation,
+        operation_func=LightRAGClient.merge_entities,
+        kwargs={
+            "source_entities": source_entities,
+            "target_entity": target_entity,
+            "merge_strategy": merge_strategy,
+        },
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -378,29 +859,12 @@ async def merge_entities(
 async def create_entities(
     ctx: Context,
     entities: List[Dict[str, Any]] = Field(
-        description="""
-        List of entity dictionaries, each containing:
-        - entity_name (str): Name of the entity
-        - entity_type (str): Type of the entity
-        - description (str): Description of the entity
-        - source_id (str): Source ID (document)
-        
-        Example:
-        [
-            {
-                "entity_name": "Python",
-                "entity_type": "PROGRAMMING_LANGUAGE",
-                "description": "Python is a high-level programming language",
-                "source_id": "doc123"
-            },
-            {
-                "entity_name": "JavaScript",
-                "entity_type": "PROGRAMMING_LANGUAGE",
-                "description": "JavaScript is a scripting language",
-                "source_id": "doc456"
-            }
-        ]
-        """
+        description=(
+            "Entities to create, each with entity_name, entity_type, description and "
+            'source_id (document ID). Example: [{"entity_name": "Python", '
+            '"entity_type": "PROGRAMMING_LANGUAGE", "description": "A programming language", '
+            '"source_id": "doc123"}]'
+        )
     ),
 ) -> Dict[str, Any]:
     """
@@ -442,11 +906,6 @@ async def create_entities(
             return {"entity_name": str(entity_name), "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        entity_names = [entity.get("entity_name", "unknown") for entity in entities]
-        entity_names_str = ", ".join(entity_names[:5])
-        if len(entity_names) > 5:
-            entity_names_str += f" and {len(entity_names) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_create_entity(client, entity_data) for entity_data in entities]
         results = await asyncio.gather(*tasks)
@@ -462,6 +921,7 @@ async def create_entities(
         operation_name=f"bulk entity creation: {len(entities)} entities",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -471,12 +931,7 @@ async def create_entities(
 async def delete_by_entities(
     ctx: Context,
     entity_names: List[str] = Field(
-        description="""
-        List of entity names to delete.
-        
-        Example:
-        ["Python", "JavaScript", "TypeScript"]
-        """
+        description='Names of entities to delete. Example: ["Python", "JavaScript"]'
     ),
 ) -> Dict[str, Any]:
     """
@@ -497,10 +952,6 @@ async def delete_by_entities(
             return {"entity_name": entity_name, "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        entity_names_str = ", ".join(entity_names[:5])
-        if len(entity_names) > 5:
-            entity_names_str += f" and {len(entity_names) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_delete_entity(client, entity_name) for entity_name in entity_names]
         results = await asyncio.gather(*tasks)
@@ -516,6 +967,7 @@ async def delete_by_entities(
         operation_name=f"bulk entity deletion: {len(entity_names)} entities",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -526,12 +978,7 @@ async def delete_by_entities(
 async def delete_by_doc_ids(
     ctx: Context,
     doc_ids: List[str] = Field(
-        description="""
-        List of document IDs to delete entities from.
-        
-        Example:
-        ["doc123", "doc456", "doc789"]
-        """
+        description='IDs of documents whose entities to delete. Example: ["doc123", "doc456"]'
     ),
 ) -> Dict[str, Any]:
     """
@@ -552,10 +999,6 @@ async def delete_by_doc_ids(
             return {"doc_id": doc_id, "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        doc_ids_str = ", ".join(doc_ids[:5])
-        if len(doc_ids) > 5:
-            doc_ids_str += f" and {len(doc_ids) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_delete_by_doc_id(client, doc_id) for doc_id in doc_ids]
         results = await asyncio.gather(*tasks)
@@ -571,6 +1014,7 @@ async def delete_by_doc_ids(
         operation_name=f"bulk deletion by document IDs: {len(doc_ids)} documents",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -578,29 +1022,12 @@ async def delete_by_doc_ids(
 async def edit_entities(
     ctx: Context,
     entities: List[Dict[str, Any]] = Field(
-        description="""
-        List of entity dictionaries to edit, each containing:
-        - entity_name (str): Name of the entity to edit
-        - entity_type (str): New entity type
-        - description (str): New entity description
-        - source_id (str): Source ID (document)
-        
-        Example:
-        [
-            {
-                "entity_name": "Python",
-                "entity_type": "PROGRAMMING_LANGUAGE",
-                "description": "Updated description for Python",
-                "source_id": "doc123"
-            },
-            {
-                "entity_name": "JavaScript",
-                "entity_type": "PROGRAMMING_LANGUAGE",
-                "description": "Updated description for JavaScript",
-                "source_id": "doc456"
-            }
-        ]
-        """
+        description=(
+            "Entities to edit, each with entity_name of an existing entity and its new "
+            "entity_type, description and source_id (document ID). Example: "
+            '[{"entity_name": "Python", "entity_type": "PROGRAMMING_LANGUAGE", '
+            '"description": "Updated description", "source_id": "doc123"}]'
+        )
     ),
 ) -> Dict[str, Any]:
     """
@@ -642,11 +1069,6 @@ async def edit_entities(
             return {"entity_name": str(entity_name), "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        entity_names = [entity.get("entity_name", "unknown") for entity in entities]
-        entity_names_str = ", ".join(entity_names[:5])
-        if len(entity_names) > 5:
-            entity_names_str += f" and {len(entity_names) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_edit_entity(client, entity_data) for entity_data in entities]
         results = await asyncio.gather(*tasks)
@@ -662,6 +1084,7 @@ async def edit_entities(
         operation_name=f"bulk entity editing: {len(entities)} entities",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -672,35 +1095,12 @@ async def edit_entities(
 async def create_relations(
     ctx: Context,
     relations: List[Dict[str, Any]] = Field(
-        description="""
-        List of relation dictionaries to create, each containing:
-        - source (str): Source entity name
-        - target (str): Target entity name
-        - description (str): Relationship description
-        - keywords (str): Keywords for relationship
-        - source_id (str, optional): Source ID (document)
-        - weight (float, optional): Relationship weight
-        
-        Example:
-        [
-            {
-                "source": "Python",
-                "target": "Django",
-                "description": "Python is used to build Django",
-                "keywords": "framework, web development",
-                "source_id": "doc123",
-                "weight": 0.8
-            },
-            {
-                "source": "JavaScript",
-                "target": "React",
-                "description": "JavaScript is used to build React",
-                "keywords": "framework, frontend",
-                "source_id": "doc456",
-                "weight": 0.9
-            }
-        ]
-        """
+        description=(
+            "Relations to create, each with source and target entity names, description, "
+            "keywords and optional source_id (document ID) and weight (float). Example: "
+            '[{"source": "Python", "target": "Django", "description": "Django is written in '
+            'Python", "keywords": "framework, web", "source_id": "doc123", "weight": 0.8}]'
+        )
     ),
 ) -> Dict[str, Any]:
     """
@@ -746,13 +1146,6 @@ async def create_relations(
             return {"relation": f"{source} -> {target}", "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        relation_strs = [
-            f"{r.get('source', 'unknown')} -> {r.get('target', 'unknown')}" for r in relations
-        ]
-        relation_strs_sample = ", ".join(relation_strs[:5])
-        if len(relation_strs) > 5:
-            relation_strs_sample += f" and {len(relation_strs) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_create_relation(client, relation_data) for relation_data in relations]
         results = await asyncio.gather(*tasks)
@@ -768,6 +1161,7 @@ async def create_relations(
         operation_name=f"bulk relationship creation: {len(relations)} relationships",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
     )
 
 
@@ -778,38 +1172,13 @@ async def create_relations(
 async def edit_relations(
     ctx: Context,
     relations: List[Dict[str, Any]] = Field(
-        description="""
-        List of relation dictionaries to edit, each containing:
-        - source (str): Source entity name
-        - target (str): Target entity name
-        - description (str): New relationship description
-        - keywords (str): New keywords for relationship
-        - relation_type (str): Relationship type
-        - source_id (str, optional): Source ID (document)
-        - weight (float, optional): New relationship weight
-        
-        Example:
-        [
-            {
-                "source": "Python",
-                "target": "Django",
-                "description": "Updated description for Python-Django relation",
-                "keywords": "framework, web development, updated",
-                "relation_type": "USES",
-                "source_id": "doc123",
-                "weight": 0.85
-            },
-            {
-                "source": "JavaScript",
-                "target": "React",
-                "description": "Updated description for JavaScript-React relation",
-                "keywords": "framework, frontend, updated",
-                "relation_type": "USES",
-                "source_id": "doc456",
-                "weight": 0.95
-            }
-        ]
-        """
+        description=(
+            "Relations to edit, each with source and target entity names and the new "
+            "description, keywords, relation_type and optional source_id (document ID) and "
+            'weight (float). Example: [{"source": "Python", "target": "Django", '
+            '"description": "Updated description", "keywords": "framework, web", '
+            '"relation_type": "USES", "source_id": "doc123", "weight": 0.85}]'
+        )
     ),
 ) -> Dict[str, Any]:
     """
@@ -857,13 +1226,6 @@ async def edit_relations(
             return {"relation": f"{source} -> {target}", "status": "error", "error": str(e)}
 
     async def _operation(client: LightRAGClient) -> Any:
-        relation_strs = [
-            f"{r.get('source', 'unknown')} -> {r.get('target', 'unknown')}" for r in relations
-        ]
-        relation_strs_sample = ", ".join(relation_strs[:5])
-        if len(relation_strs) > 5:
-            relation_strs_sample += f" and {len(relation_strs) - 5} more"
-
         # Create tasks for parallel execution
         tasks = [_edit_relation(client, relation_data) for relation_data in relations]
         results = await asyncio.gather(*tasks)
@@ -879,4 +1241,154 @@ async def edit_relations(
         operation_name=f"bulk relationship editing: {len(relations)} relationships",
         operation_func=_operation,
         ctx=ctx,
+        invalidates_cache=True,
+    )
+
+
+# LightRAGClient methods that batch_operations may call, keyed by operation name
+_BATCH_OPERATIONS: Dict[str, Callable[..., Awaitable[Any]]] = {
+    "query": LightRAGClient.query,
+    "insert_text": LightRAGClient.insert_text,
+    "insert_texts": LightRAGClient.insert_texts,
+    "upload_document": LightRAGClient.upload_document,
+    "insert_file": LightRAGClient.insert_file,
+    "insert_batch": LightRAGClient.insert_batch,
+    "scan_for_new_documents": LightRAGClient.scan_for_new_documents,
+    "get_documents": LightRAGClient.get_documents,
+    "get_pipeline_status": LightRAGClient.get_pipeline_status,
+    "get_graph_labels": LightRAGClient.get_graph_labels,
+    "get_health": LightRAGClient.get_health,
+    "delete_by_entity": LightRAGClient.delete_by_entity,
+    "delete_by_doc_id": LightRAGClient.delete_by_doc_id,
+    "create_entity": LightRAGClient.create_entity,
+    "edit_entity": LightRAGClient.edit_entity,
+    "create_relation": LightRAGClient.create_relation,
+    "edit_relation": LightRAGClient.edit_relation,
+    "merge_entities": LightRAGClient.merge_entities,
+}
+# Batch operations that read local files; they share the file-operation limit of the
+# dedicated tools and, unless a timeout is given, run without one
+_BATCH_FILE_OPERATIONS = frozenset({"upload_document", "insert_file", "insert_batch"})
+# Batch operations that leave LightRAG state unchanged and so keep cached reads valid
+_BATCH_READ_OPERATIONS = frozenset(
+    {"query", "get_documents", "get_pipeline_status", "get_graph_labels", "get_health"}
+)
+_BATCH_DEFAULT_TIMEOUT_MS = 30000
+
+
+def _describe_batch_operation(name: str, method: Callable[..., Awaitable[Any]]) -> str:
+    """
+    Describes a batch operation for the batch_operations tool schema.
+
+    Args:
+        name: Operation name
+        method: LightRAGClient method the operation calls
+
+    Returns:
+        str: Operation name with its argument names, optional ones marked with "?"
+    """
+    parameters = list(inspect.signature(method).parameters.values())[1:]
+    args = ", ".join(
+        parameter.name + ("" if parameter.default is inspect.Parameter.empty else "?")
+        for parameter in parameters
+    )
+    return f"{name}({args})"
+
+
+@mcp.tool(
+    name="batch_operations",
+    description="Execute several LightRAG operations concurrently in a single call",
+)
+async def batch_operations(
+    ctx: Context,
+    operations: List[Dict[str, Any]] = Field(
+        description=(
+            'Operations to run concurrently, each an object {"name": <operation>, "args": '
+            "{<argument>: <value>, ...}}. args may be omitted for operations without "
+            "required arguments. Accepted operations and their arguments (? marks optional "
+            "ones): "
+            + "; ".join(
+                _describe_batch_operation(name, method)
+                for name, method in _BATCH_OPERATIONS.items()
+            )
+            + ". Results keep the order of the operations"
+        ),
+    ),
+    max_concurrent: int = Field(
+        description="Maximum number of operations running at the same time", default=8, ge=1
+    ),
+    stop_on_error: bool = Field(
+        description="Cancel operations that are still running once one of them fails",
+        default=False,
+    ),
+    timeout_ms: Optional[int] = Field(
+        description=(
+            "Time limit for each operation in milliseconds. Defaults to "
+            f"{_BATCH_DEFAULT_TIMEOUT_MS}; file operations are not limited unless it is set"
+        ),
+        default=None,
+        ge=1,
+    ),
+) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _run_operation(client: LightRAGClient, operation: Dict[str, Any]) -> Dict[str, Any]:
+        name = operation.get("name")
+        method = _BATCH_OPERATIONS.get(str(name))
+        if method is None:
+            return format_response(f"Unknown operation: {name}", is_error=True)
+
+        is_file_operation = name in _BATCH_FILE_OPERATIONS
+        operation_timeout_ms = timeout_ms
+        if operation_timeout_ms is None and not is_file_operation:
+            operation_timeout_ms = _BATCH_DEFAULT_TIMEOUT_MS
+        timeout = operation_timeout_ms / 1000 if operation_timeout_ms is not None else None
+        file_limit = _FILE_OPERATION_LIMIT if is_file_operation else nullcontext()
+
+        try:
+            async with semaphore, file_limit:
+                result = await asyncio.wait_for(
+                    method(client, **operation.get("args", {})), timeout
+                )
+            return format_response(result)
+        except asyncio.TimeoutError:
+            logger.error("Batch operation %s timed out after %s ms", name, operation_timeout_ms)
+            return format_response(
+                f"Operation timed out after {operation_timeout_ms} ms", is_error=True
+            )
+        except Exception as e:
+            logger.exception("Error during batch operation %s: %s", name, e)
+            return format_response(e, is_error=True)
+
+    async def _operation(client: LightRAGClient) -> Any:
+        tasks = [asyncio.create_task(_run_operation(client, op)) for op in operations]
+        if stop_on_error:
+            for next_done in asyncio.as_completed(tasks):
+                if (await next_done)["status"] == "error":
+                    for task in tasks:
+                        task.cancel()
+                    break
+
+        results = [
+            format_response("Cancelled after another operation failed", is_error=True)
+            if isinstance(result, asyncio.CancelledError)
+            else result
+            for result in await asyncio.gather(*tasks, return_exceptions=True)
+        ]
+
+        return {
+            "total": len(operations),
+            "successful": sum(1 for r in results if r["status"] == "success"),
+            "failed": sum(1 for r in results if r["status"] == "error"),
+            "results": results,
+        }
+
+    return await execute_lightrag_operation(
+        operation_name=f"batch operations: {len(operations)} operations",
+        operation_func=_operation,
+        ctx=ctx,
+        invalidates_cache=any(
+            op.get("name") in _BATCH_OPERATIONS and op.get("name") not in _BATCH_READ_OPERATIONS
+            for op in operations
+        ),
     )